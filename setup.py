@@ -1,11 +1,34 @@
-from setuptools import find_packages, setup
+from setuptools import Extension, find_packages, setup
 
 PACKAGE = "zc_parking"
 
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "zc_parking._svy21",
+                ["zc_parking/_svy21.pyx"],
+                extra_compile_args=["-O3", "-ffast-math", "-fopenmp"],
+                extra_link_args=["-fopenmp"],
+            )
+        ],
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    )
+except ImportError:
+    # cython is optional; the package falls back to numba/numpy kernels
+    ext_modules = []
+
 setup(
     name="zc-parking",
     version="0.0.1",
     packages=find_packages(include=PACKAGE),
+    ext_modules=ext_modules,
     install_requires=[
         "pandas",
         "numpy",
@@ -14,6 +37,12 @@ setup(
         "loguru",
     ],
     extras_require={
+        "speedups": [
+            "numba",
+            "cython",
+            "orjson",
+            "pyarrow",
+        ],
         "dev": [
             "black",
             "isort",
@@ -27,6 +56,6 @@ setup(
             "pyright",
             "pylint",
             "pandas-stubs",
-        ]
+        ],
     },
 )
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from zc_parking import coordinate_transformation
+from zc_parking.coordinate_transformation import CoordinateTransformation
+
+TRANSFORMER = CoordinateTransformation()
+
+# coarse grid covering Singapore
+_GRID_LATITUDES, _GRID_LONGITUDES = np.meshgrid(
+    np.linspace(1.2, 1.48, 8), np.linspace(103.6, 104.1, 8)
+)
+GRID_LATITUDES = _GRID_LATITUDES.ravel()
+GRID_LONGITUDES = _GRID_LONGITUDES.ravel()
+
+
+def _scalar_forward(latitudes: np.ndarray, longitudes: np.ndarray):
+    coordinates = [
+        TRANSFORMER.convert_lat_lon_to_svy21(latitude, longitude)
+        for latitude, longitude in zip(latitudes, longitudes)
+    ]
+    northings = np.array([coordinate.northing for coordinate in coordinates])
+    eastings = np.array([coordinate.easting for coordinate in coordinates])
+    return northings, eastings
+
+
+def _scalar_inverse(northings: np.ndarray, eastings: np.ndarray):
+    coordinates = [
+        TRANSFORMER.convert_svy21_to_lat_lon(northing, easting)
+        for northing, easting in zip(northings, eastings)
+    ]
+    latitudes = np.array([coordinate.latitude for coordinate in coordinates])
+    longitudes = np.array([coordinate.longitude for coordinate in coordinates])
+    return latitudes, longitudes
+
+
+def test_batch_forward_matches_scalar():
+    batch_northings, batch_eastings = TRANSFORMER.convert_lat_lon_to_svy21_batch(
+        GRID_LATITUDES, GRID_LONGITUDES
+    )
+    northings, eastings = _scalar_forward(GRID_LATITUDES, GRID_LONGITUDES)
+    np.testing.assert_allclose(batch_northings, northings, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(batch_eastings, eastings, rtol=0, atol=1e-9)
+
+
+def test_batch_inverse_matches_scalar():
+    northings, eastings = _scalar_forward(GRID_LATITUDES, GRID_LONGITUDES)
+    batch_latitudes, batch_longitudes = TRANSFORMER.convert_svy21_to_lat_lon_batch(
+        northings, eastings
+    )
+    latitudes, longitudes = _scalar_inverse(northings, eastings)
+    np.testing.assert_allclose(batch_latitudes, latitudes, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(batch_longitudes, longitudes, rtol=0, atol=1e-9)
+
+
+def test_c_extension_matches_scalar(monkeypatch):
+    pytest.importorskip("zc_parking._svy21")
+    monkeypatch.setattr(coordinate_transformation, "_HAS_NUMBA", False)
+
+    batch_northings, batch_eastings = TRANSFORMER.convert_lat_lon_to_svy21_batch(
+        GRID_LATITUDES, GRID_LONGITUDES
+    )
+    northings, eastings = _scalar_forward(GRID_LATITUDES, GRID_LONGITUDES)
+    np.testing.assert_allclose(batch_northings, northings, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(batch_eastings, eastings, rtol=0, atol=1e-9)
+
+    batch_latitudes, batch_longitudes = TRANSFORMER.convert_svy21_to_lat_lon_batch(
+        northings, eastings
+    )
+    latitudes, longitudes = _scalar_inverse(northings, eastings)
+    np.testing.assert_allclose(batch_latitudes, latitudes, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(batch_longitudes, longitudes, rtol=0, atol=1e-9)
+
+
+def test_ufunc_matches_batch():
+    northings, eastings = _scalar_forward(GRID_LATITUDES, GRID_LONGITUDES)
+    ufunc_latitudes, ufunc_longitudes = (
+        coordinate_transformation.svy21_to_lat_lon_ufunc(northings, eastings)
+    )
+    batch_latitudes, batch_longitudes = TRANSFORMER.convert_svy21_to_lat_lon_batch(
+        northings, eastings
+    )
+    np.testing.assert_array_equal(ufunc_latitudes, batch_latitudes)
+    np.testing.assert_array_equal(ufunc_longitudes, batch_longitudes)
+
+
+def test_svy21_to_lat_lon_fixed_points():
+    # pins the inverse conversion after the radius-of-curvature fix
+    # (1 - e^2 * sin^2(lat) was previously computed with a single sin factor)
+    fixed_points = [
+        ((30000.0, 20000.0), (1.2881180841870679, 104.01416026964026)),
+        ((38744.572, 28001.642), (1.366666, 104.08649781975265)),
+        ((45000.0, 35000.0), (1.4228547951587442, 104.14976276057976)),
+    ]
+    for (northing, easting), (latitude, longitude) in fixed_points:
+        result = TRANSFORMER.convert_svy21_to_lat_lon(northing, easting)
+        assert result.latitude == pytest.approx(latitude, rel=0, abs=1e-9)
+        assert result.longitude == pytest.approx(longitude, rel=0, abs=1e-9)
+
+
+def test_lat_lon_to_svy21_fixed_point():
+    result = TRANSFORMER.convert_lat_lon_to_svy21(1.3521, 103.8198)
+    assert result.northing == pytest.approx(37133.938095353806, rel=0, abs=1e-6)
+    assert result.easting == pytest.approx(27966.338786737142, rel=0, abs=1e-6)
+
+
+def test_numpy_fallback_matches_scalar(monkeypatch):
+    monkeypatch.setattr(coordinate_transformation, "_HAS_NUMBA", False)
+    monkeypatch.setattr(coordinate_transformation, "batch_lat_lon_to_svy21", None)
+    monkeypatch.setattr(coordinate_transformation, "batch_svy21_to_lat_lon", None)
+
+    batch_northings, batch_eastings = TRANSFORMER.convert_lat_lon_to_svy21_batch(
+        GRID_LATITUDES, GRID_LONGITUDES
+    )
+    northings, eastings = _scalar_forward(GRID_LATITUDES, GRID_LONGITUDES)
+    np.testing.assert_allclose(batch_northings, northings, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(batch_eastings, eastings, rtol=0, atol=1e-9)
+
+    batch_latitudes, batch_longitudes = TRANSFORMER.convert_svy21_to_lat_lon_batch(
+        northings, eastings
+    )
+    latitudes, longitudes = _scalar_inverse(northings, eastings)
+    np.testing.assert_allclose(batch_latitudes, latitudes, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(batch_longitudes, longitudes, rtol=0, atol=1e-9)
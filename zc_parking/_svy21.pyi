@@ -0,0 +1,33 @@
+# pylint: disable=missing-module-docstring,missing-function-docstring
+# pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument
+import numpy as np
+
+def batch_lat_lon_to_svy21(
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    coefficient_a1: float,
+    coefficient_a2: float,
+    coefficient_a3: float,
+    coefficient_a4: float,
+    semi_major_axis: float,
+    origin_lon_rad: float,
+    meridian_distance_origin: float,
+    false_northing: float,
+    false_easting: float,
+    scale_factor: float,
+    northing_out: np.ndarray,
+    easting_out: np.ndarray,
+) -> None: ...
+def batch_svy21_to_lat_lon(
+    northings: np.ndarray,
+    eastings: np.ndarray,
+    coefficient_a2: float,
+    semi_major_axis: float,
+    eccentricity_squared: float,
+    origin_lat_rad: float,
+    origin_lon_rad: float,
+    false_northing: float,
+    scale_factor: float,
+    latitude_out: np.ndarray,
+    longitude_out: np.ndarray,
+) -> None: ...
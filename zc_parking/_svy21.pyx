@@ -0,0 +1,321 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+# AOT-compiled SVY21 <-> lat/lon kernels, mirroring the numba kernels in
+# coordinate_transformation.py for environments where numba's import and
+# first-call JIT cost is unwanted.
+
+from cython.parallel import prange
+
+from libc.math cimport M_PI, cos, sin, sqrt, tan
+
+
+cdef inline double _radians(double degrees) nogil:
+    return degrees * (M_PI / 180.0)
+
+
+cdef inline double _degrees(double radians) nogil:
+    return radians * (180.0 / M_PI)
+
+
+def batch_lat_lon_to_svy21(
+    double[::1] latitude,
+    double[::1] longitude,
+    double coefficient_a1,
+    double coefficient_a2,
+    double coefficient_a3,
+    double coefficient_a4,
+    double semi_major_axis,
+    double origin_lon_rad,
+    double meridian_distance_origin,
+    double false_northing,
+    double false_easting,
+    double scale_factor,
+    double[::1] northing_out,
+    double[::1] easting_out,
+):
+    cdef Py_ssize_t i, n = latitude.shape[0]
+    cdef double latitude_radians, longitude_radians
+    cdef double sin_latitude, cos_latitude, meridian_distance, delta_longitude
+    cdef double sin_squared_latitude, cos_squared_latitude, cos_cubed_latitude
+    cdef double cos_fourth_latitude, cos_fifth_latitude, cos_sixth_latitude
+    cdef double cos_seventh_latitude
+    cdef double delta_longitude_squared, delta_longitude_fourth
+    cdef double delta_longitude_sixth, delta_longitude_eighth
+    cdef double a2_squared = coefficient_a2 * coefficient_a2
+    cdef double a2_cubed = a2_squared * coefficient_a2
+    cdef double northing_term1, northing_term2, northing_term3, northing_term4
+    cdef double easting_term1, easting_term2, easting_term3
+
+    for i in prange(n, nogil=True, schedule="static"):
+        latitude_radians = _radians(latitude[i])
+        longitude_radians = _radians(longitude[i])
+
+        sin_latitude = sin(latitude_radians)
+        cos_latitude = cos(latitude_radians)
+
+        meridian_distance = semi_major_axis * (
+            coefficient_a1 * latitude_radians
+            - coefficient_a2 * sin(2 * latitude_radians)
+            + coefficient_a3 * sin(4 * latitude_radians)
+            - coefficient_a4 * sin(6 * latitude_radians)
+        )
+        delta_longitude = longitude_radians - origin_lon_rad
+
+        sin_squared_latitude = sin_latitude * sin_latitude
+        cos_squared_latitude = cos_latitude * cos_latitude
+        cos_cubed_latitude = cos_squared_latitude * cos_latitude
+        cos_fourth_latitude = cos_squared_latitude * cos_squared_latitude
+        cos_fifth_latitude = cos_fourth_latitude * cos_latitude
+        cos_sixth_latitude = cos_fourth_latitude * cos_squared_latitude
+        cos_seventh_latitude = cos_sixth_latitude * cos_latitude
+        delta_longitude_squared = delta_longitude * delta_longitude
+        delta_longitude_fourth = delta_longitude_squared * delta_longitude_squared
+        delta_longitude_sixth = delta_longitude_fourth * delta_longitude_squared
+        delta_longitude_eighth = delta_longitude_fourth * delta_longitude_fourth
+
+        northing_term1 = (
+            delta_longitude_squared
+            / 2
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_latitude
+        )
+        northing_term2 = (
+            delta_longitude_fourth
+            / 24
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_cubed_latitude
+            * (4 * a2_squared + coefficient_a2 - sin_squared_latitude)
+        )
+        northing_term3 = (
+            delta_longitude_sixth
+            / 720
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_fifth_latitude
+            * (
+                (8 * a2_cubed) * (11 - 24 * sin_squared_latitude)
+                - (28 * a2_squared) * (1 - 6 * sin_squared_latitude)
+                + a2_squared * (1 - 32 * sin_squared_latitude)
+                - coefficient_a2 * 2 * sin_squared_latitude
+                + cos_fourth_latitude
+            )
+        )
+        northing_term4 = (
+            delta_longitude_eighth
+            / 40320
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_seventh_latitude
+            * (
+                1385
+                - 3111 * sin_squared_latitude
+                + 543 * cos_fourth_latitude
+                - cos_sixth_latitude
+            )
+        )
+
+        northing_out[i] = false_northing + scale_factor * (
+            meridian_distance
+            - meridian_distance_origin
+            + northing_term1
+            + northing_term2
+            + northing_term3
+            + northing_term4
+        )
+
+        easting_term1 = (
+            delta_longitude_squared
+            / 6
+            * cos_latitude
+            * (coefficient_a2 - sin_squared_latitude)
+        )
+        easting_term2 = (
+            delta_longitude_fourth
+            / 120
+            * cos_fourth_latitude
+            * (
+                (4 * a2_cubed) * (1 - 6 * sin_squared_latitude)
+                + a2_squared * (1 + 8 * sin_squared_latitude)
+                - coefficient_a2 * 2 * sin_squared_latitude
+                + cos_fourth_latitude
+            )
+        )
+        easting_term3 = (
+            delta_longitude_sixth
+            / 5040
+            * cos_sixth_latitude
+            * (
+                61
+                - 479 * sin_squared_latitude
+                + 179 * cos_fourth_latitude
+                - cos_sixth_latitude
+            )
+        )
+
+        easting_out[i] = (
+            false_easting
+            + scale_factor
+            * meridian_distance
+            * delta_longitude
+            * cos_latitude
+            * (1 + easting_term1 + easting_term2 + easting_term3)
+        )
+
+
+def batch_svy21_to_lat_lon(
+    double[::1] northings,
+    double[::1] eastings,
+    double coefficient_a2,
+    double semi_major_axis,
+    double eccentricity_squared,
+    double origin_lat_rad,
+    double origin_lon_rad,
+    double false_northing,
+    double scale_factor,
+    double[::1] latitude_out,
+    double[::1] longitude_out,
+):
+    cdef Py_ssize_t i, n = northings.shape[0]
+    cdef int iteration
+    cdef double a2_squared = coefficient_a2 * coefficient_a2
+    cdef double a2_cubed = a2_squared * coefficient_a2
+    cdef double a2_fourth = a2_squared * a2_squared
+    cdef double a2_fifth = a2_fourth * coefficient_a2
+    cdef double a2_sixth = a2_fourth * a2_squared
+    cdef double latitude_radians, longitude_radians
+    cdef double sin_latitude, sin_squared_latitude
+    cdef double radius_of_curvature_prime_vertical, radius_of_curvature
+    cdef double denominator, denominator_cubed, denominator_fifth
+    cdef double denominator_seventh
+    cdef double latitude_term1, latitude_term2, latitude_term3, latitude_term4
+    cdef double sec_latitude, tangent_latitude, tangent_squared_latitude, poly
+    cdef double longitude_term1, longitude_term2, longitude_term3, longitude_term4
+
+    for i in prange(n, nogil=True, schedule="static"):
+        latitude_radians = origin_lat_rad
+
+        for iteration in range(5):  # Perform 5 iterations for convergence
+            sin_latitude = sin(latitude_radians)
+            sin_squared_latitude = sin_latitude * sin_latitude
+            radius_of_curvature_prime_vertical = semi_major_axis / sqrt(
+                1 - eccentricity_squared * sin_latitude
+            )
+            denominator = scale_factor * radius_of_curvature_prime_vertical
+            denominator_cubed = denominator * denominator * denominator
+            denominator_fifth = denominator_cubed * denominator * denominator
+            denominator_seventh = denominator_fifth * denominator * denominator
+
+            latitude_term1 = (northings[i] - false_northing) / denominator
+            latitude_term2 = (
+                latitude_term1
+                / denominator_cubed
+                * (
+                    -coefficient_a2
+                    / 6
+                    * (
+                        1
+                        - a2_squared
+                        * (
+                            5
+                            + 3 * coefficient_a2
+                            + 10 * a2_squared
+                            - 4 * a2_cubed
+                            - 9 * sin_squared_latitude
+                        )
+                    )
+                )
+            )
+            latitude_term3 = (
+                latitude_term1
+                / denominator_fifth
+                * (
+                    -a2_cubed
+                    / 120
+                    * (
+                        5
+                        - 18 * a2_squared
+                        + a2_fourth
+                        + 14 * sin_squared_latitude
+                        - 58 * a2_squared * sin_squared_latitude
+                    )
+                )
+            )
+            latitude_term4 = (
+                latitude_term1
+                / denominator_seventh
+                * (
+                    -a2_fifth
+                    / 5040
+                    * (61 - 479 * a2_squared + 179 * a2_fourth - a2_sixth)
+                )
+            )
+
+            latitude_radians = (
+                origin_lat_rad
+                + latitude_term1
+                + latitude_term2
+                + latitude_term3
+                + latitude_term4
+            )
+
+        sin_latitude = sin(latitude_radians)
+        sec_latitude = 1.0 / cos(latitude_radians)
+        tangent_latitude = tan(latitude_radians)
+        tangent_squared_latitude = tangent_latitude * tangent_latitude
+
+        poly = 1 - eccentricity_squared * sin_latitude * sin_latitude
+        radius_of_curvature = (
+            semi_major_axis * (1 - eccentricity_squared) / (poly * sqrt(poly))
+        )
+        denominator = scale_factor * radius_of_curvature * sec_latitude
+        denominator_cubed = denominator * denominator * denominator
+        denominator_fifth = denominator_cubed * denominator * denominator
+        denominator_seventh = denominator_fifth * denominator * denominator
+
+        longitude_term1 = eastings[i] / denominator
+        longitude_term2 = (
+            longitude_term1
+            / denominator_cubed
+            * (coefficient_a2 / 2 * tangent_squared_latitude)
+        )
+        longitude_term3 = (
+            longitude_term1
+            / denominator_fifth
+            * (
+                coefficient_a2
+                / 24
+                * tangent_squared_latitude
+                * (
+                    5
+                    - tangent_squared_latitude
+                    + 9 * coefficient_a2
+                    + 4 * coefficient_a2 * coefficient_a2
+                )
+            )
+        )
+        longitude_term4 = (
+            longitude_term1
+            / denominator_seventh
+            * (
+                coefficient_a2
+                / 720
+                * tangent_squared_latitude
+                * (
+                    61
+                    + 90 * tangent_squared_latitude
+                    + 45 * tangent_squared_latitude * tangent_squared_latitude
+                )
+            )
+        )
+
+        longitude_radians = (
+            origin_lon_rad
+            + longitude_term1
+            + longitude_term2
+            + longitude_term3
+            + longitude_term4
+        )
+
+        latitude_out[i] = _degrees(latitude_radians)
+        longitude_out[i] = _degrees(longitude_radians)
@@ -1,7 +1,36 @@
-from typing import Dict, NamedTuple
+import math
+from typing import NamedTuple, Tuple, TypeVar
 
 import numpy as np
 
+# the northing/easting polynomials work element-wise on floats (scalar path)
+# and ndarrays (batch path) alike
+FloatOrArray = TypeVar("FloatOrArray", float, np.ndarray)
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # pylint: disable=unused-argument
+        def wrap(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+    prange = range
+
+try:
+    from zc_parking._svy21 import batch_lat_lon_to_svy21, batch_svy21_to_lat_lon
+except ImportError:
+    # compiled extension is optional; build it with `make build-ext`
+    batch_lat_lon_to_svy21 = None
+    batch_svy21_to_lat_lon = None
+
 
 class SVY21Coordinates(NamedTuple):
     northing: float
@@ -13,8 +42,330 @@ class DegreeCoordinates(NamedTuple):
     longitude: float
 
 
+class EquatorialArcConstants(NamedTuple):
+    a1: float
+    a2: float
+    a3: float
+    a4: float
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _latlon_to_svy21_kernel(
+    latitude,
+    longitude,
+    coefficient_a1,
+    coefficient_a2,
+    coefficient_a3,
+    coefficient_a4,
+    semi_major_axis,
+    origin_lon_rad,
+    meridian_distance_origin,
+    false_northing,
+    false_easting,
+    scale_factor,
+    northing_out,
+    easting_out,
+):
+    # per-point scalar math so numba can fuse the whole polynomial into one
+    # kernel without numpy temporaries
+    for i in prange(latitude.shape[0]):  # pylint: disable=not-an-iterable
+        latitude_radians = math.radians(latitude[i])
+        longitude_radians = math.radians(longitude[i])
+
+        sin_latitude = math.sin(latitude_radians)
+        cos_latitude = math.cos(latitude_radians)
+
+        meridian_distance = semi_major_axis * (
+            coefficient_a1 * latitude_radians
+            - coefficient_a2 * math.sin(2 * latitude_radians)
+            + coefficient_a3 * math.sin(4 * latitude_radians)
+            - coefficient_a4 * math.sin(6 * latitude_radians)
+        )
+        delta_longitude = longitude_radians - origin_lon_rad
+
+        sin_squared_latitude = sin_latitude * sin_latitude
+        cos_squared_latitude = cos_latitude * cos_latitude
+        cos_cubed_latitude = cos_squared_latitude * cos_latitude
+        cos_fourth_latitude = cos_squared_latitude * cos_squared_latitude
+        cos_fifth_latitude = cos_fourth_latitude * cos_latitude
+        cos_sixth_latitude = cos_fourth_latitude * cos_squared_latitude
+        cos_seventh_latitude = cos_sixth_latitude * cos_latitude
+        delta_longitude_squared = delta_longitude * delta_longitude
+        delta_longitude_fourth = delta_longitude_squared * delta_longitude_squared
+        delta_longitude_sixth = delta_longitude_fourth * delta_longitude_squared
+        delta_longitude_eighth = delta_longitude_fourth * delta_longitude_fourth
+        a2_squared = coefficient_a2 * coefficient_a2
+        a2_cubed = a2_squared * coefficient_a2
+
+        northing_term1 = (
+            delta_longitude_squared
+            / 2
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_latitude
+        )
+        northing_term2 = (
+            delta_longitude_fourth
+            / 24
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_cubed_latitude
+            * (4 * a2_squared + coefficient_a2 - sin_squared_latitude)
+        )
+        northing_term3 = (
+            delta_longitude_sixth
+            / 720
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_fifth_latitude
+            * (
+                (8 * a2_cubed) * (11 - 24 * sin_squared_latitude)
+                - (28 * a2_squared) * (1 - 6 * sin_squared_latitude)
+                + a2_squared * (1 - 32 * sin_squared_latitude)
+                - coefficient_a2 * 2 * sin_squared_latitude
+                + cos_fourth_latitude
+            )
+        )
+        northing_term4 = (
+            delta_longitude_eighth
+            / 40320
+            * meridian_distance_origin
+            * sin_latitude
+            * cos_seventh_latitude
+            * (
+                1385
+                - 3111 * sin_squared_latitude
+                + 543 * cos_fourth_latitude
+                - cos_sixth_latitude
+            )
+        )
+
+        northing_out[i] = false_northing + scale_factor * (
+            meridian_distance
+            - meridian_distance_origin
+            + northing_term1
+            + northing_term2
+            + northing_term3
+            + northing_term4
+        )
+
+        easting_term1 = (
+            delta_longitude_squared
+            / 6
+            * cos_latitude
+            * (coefficient_a2 - sin_squared_latitude)
+        )
+        easting_term2 = (
+            delta_longitude_fourth
+            / 120
+            * cos_fourth_latitude
+            * (
+                (4 * a2_cubed) * (1 - 6 * sin_squared_latitude)
+                + a2_squared * (1 + 8 * sin_squared_latitude)
+                - coefficient_a2 * 2 * sin_squared_latitude
+                + cos_fourth_latitude
+            )
+        )
+        easting_term3 = (
+            delta_longitude_sixth
+            / 5040
+            * cos_sixth_latitude
+            * (
+                61
+                - 479 * sin_squared_latitude
+                + 179 * cos_fourth_latitude
+                - cos_sixth_latitude
+            )
+        )
+
+        easting_out[i] = (
+            false_easting
+            + scale_factor
+            * meridian_distance
+            * delta_longitude
+            * cos_latitude
+            * (1 + easting_term1 + easting_term2 + easting_term3)
+        )
+
+
+@njit(cache=True, fastmath=True)
+def _svy21_to_latlon_point(
+    northing,
+    easting,
+    coefficient_a2,
+    semi_major_axis,
+    eccentricity_squared,
+    origin_lat_rad,
+    origin_lon_rad,
+    false_northing,
+    scale_factor,
+):
+    latitude_radians = origin_lat_rad
+    a2_squared = coefficient_a2 * coefficient_a2
+    a2_cubed = a2_squared * coefficient_a2
+    a2_fourth = a2_squared * a2_squared
+    a2_fifth = a2_fourth * coefficient_a2
+    a2_sixth = a2_fourth * a2_squared
+
+    for _ in range(5):  # Perform 5 iterations for convergence
+        sin_latitude = math.sin(latitude_radians)
+        sin_squared_latitude = sin_latitude * sin_latitude
+        radius_of_curvature_prime_vertical = semi_major_axis / math.sqrt(
+            1 - eccentricity_squared * sin_latitude
+        )
+        denominator = scale_factor * radius_of_curvature_prime_vertical
+        denominator_cubed = denominator * denominator * denominator
+        denominator_fifth = denominator_cubed * denominator * denominator
+        denominator_seventh = denominator_fifth * denominator * denominator
+
+        latitude_term1 = (northing - false_northing) / denominator
+        latitude_term2 = (
+            latitude_term1
+            / denominator_cubed
+            * (
+                -coefficient_a2
+                / 6
+                * (
+                    1
+                    - a2_squared
+                    * (
+                        5
+                        + 3 * coefficient_a2
+                        + 10 * a2_squared
+                        - 4 * a2_cubed
+                        - 9 * sin_squared_latitude
+                    )
+                )
+            )
+        )
+        latitude_term3 = (
+            latitude_term1
+            / denominator_fifth
+            * (
+                -a2_cubed
+                / 120
+                * (
+                    5
+                    - 18 * a2_squared
+                    + a2_fourth
+                    + 14 * sin_squared_latitude
+                    - 58 * a2_squared * sin_squared_latitude
+                )
+            )
+        )
+        latitude_term4 = (
+            latitude_term1
+            / denominator_seventh
+            * (-a2_fifth / 5040 * (61 - 479 * a2_squared + 179 * a2_fourth - a2_sixth))
+        )
+
+        latitude_radians = (
+            origin_lat_rad
+            + latitude_term1
+            + latitude_term2
+            + latitude_term3
+            + latitude_term4
+        )
+
+    sin_latitude = math.sin(latitude_radians)
+    sec_latitude = 1.0 / math.cos(latitude_radians)
+    tangent_latitude = math.tan(latitude_radians)
+    tangent_squared_latitude = tangent_latitude * tangent_latitude
+
+    poly = 1 - eccentricity_squared * sin_latitude * sin_latitude
+    radius_of_curvature = (
+        semi_major_axis * (1 - eccentricity_squared) / (poly * math.sqrt(poly))
+    )
+    denominator = scale_factor * radius_of_curvature * sec_latitude
+    denominator_cubed = denominator * denominator * denominator
+    denominator_fifth = denominator_cubed * denominator * denominator
+    denominator_seventh = denominator_fifth * denominator * denominator
+
+    longitude_term1 = easting / denominator
+    longitude_term2 = (
+        longitude_term1
+        / denominator_cubed
+        * (coefficient_a2 / 2 * tangent_squared_latitude)
+    )
+    longitude_term3 = (
+        longitude_term1
+        / denominator_fifth
+        * (
+            coefficient_a2
+            / 24
+            * tangent_squared_latitude
+            * (5 - tangent_squared_latitude + 9 * coefficient_a2 + 4 * a2_squared)
+        )
+    )
+    longitude_term4 = (
+        longitude_term1
+        / denominator_seventh
+        * (
+            coefficient_a2
+            / 720
+            * tangent_squared_latitude
+            * (
+                61
+                + 90 * tangent_squared_latitude
+                + 45 * tangent_squared_latitude * tangent_squared_latitude
+            )
+        )
+    )
+
+    longitude_radians = (
+        origin_lon_rad
+        + longitude_term1
+        + longitude_term2
+        + longitude_term3
+        + longitude_term4
+    )
+
+    return math.degrees(latitude_radians), math.degrees(longitude_radians)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _svy21_to_latlon_kernel(
+    northings,
+    eastings,
+    coefficient_a2,
+    semi_major_axis,
+    eccentricity_squared,
+    origin_lat_rad,
+    origin_lon_rad,
+    false_northing,
+    scale_factor,
+    latitude_out,
+    longitude_out,
+):
+    for i in prange(northings.shape[0]):  # pylint: disable=not-an-iterable
+        latitude_out[i], longitude_out[i] = _svy21_to_latlon_point(
+            northings[i],
+            eastings[i],
+            coefficient_a2,
+            semi_major_axis,
+            eccentricity_squared,
+            origin_lat_rad,
+            origin_lon_rad,
+            false_northing,
+            scale_factor,
+        )
+
+
 class CoordinateTransformation:
     # source: https://app.sla.gov.sg/sirent/About/PlaneCoordinateSystem
+    __slots__ = (
+        "semi_minor_axis",
+        "eccentricity_squared",
+        "equatorial_arc_consts",
+        "_a1",
+        "_a2",
+        "_a3",
+        "_a4",
+        "_origin_lat_rad",
+        "_origin_lon_rad",
+        "_meridian_distance_origin",
+    )
+
     SEMI_MAJOR_AXIS = 6378137.0
     FLATTENING = 1 / 298.257223563
     ORIGIN_LATITUDE = 1.366666
@@ -27,11 +378,19 @@ class CoordinateTransformation:
         self.semi_minor_axis = self.SEMI_MAJOR_AXIS * (1 - self.FLATTENING)
         self.eccentricity_squared = self._calculate_eccentricity_squared()
         self.equatorial_arc_consts = self._calculate_equatorial_arc_consts()
+        self._a1, self._a2, self._a3, self._a4 = self.equatorial_arc_consts
+        # everything below depends only on class constants, so compute it once
+        # here instead of on every conversion
+        self._origin_lat_rad = math.radians(self.ORIGIN_LATITUDE)
+        self._origin_lon_rad = math.radians(self.ORIGIN_LONGITUDE)
+        self._meridian_distance_origin = self._calculate_meridian_distance(
+            self._origin_lat_rad
+        )
 
     def _calculate_eccentricity_squared(self) -> float:
         return (2 * self.FLATTENING) - (self.FLATTENING * self.FLATTENING)
 
-    def _calculate_equatorial_arc_consts(self) -> Dict[int, float]:
+    def _calculate_equatorial_arc_consts(self) -> EquatorialArcConstants:
         e_squared = self.eccentricity_squared
         e_fourth = e_squared * e_squared
         e_sixth = e_fourth * e_squared
@@ -42,38 +401,26 @@ class CoordinateTransformation:
         coefficient_a3 = (15.0 / 256.0) * (e_fourth + (3 * e_sixth / 4))
         coefficient_a4 = 35 * e_sixth / 3072
 
-        coefficient_list = [
-            coefficient_a1,
-            coefficient_a2,
-            coefficient_a3,
-            coefficient_a4,
-        ]
-
-        return {key + 1: value for key, value in enumerate(coefficient_list)}
-
-    def degrees_to_radians(self, degrees: float) -> float:
-        return np.deg2rad(degrees)
-
-    def radians_to_degrees(self, radians: float) -> float:
-        return np.rad2deg(radians)
+        return EquatorialArcConstants(
+            a1=coefficient_a1,
+            a2=coefficient_a2,
+            a3=coefficient_a3,
+            a4=coefficient_a4,
+        )
 
     def convert_lat_lon_to_svy21(
         self, latitude: float, longitude: float
     ) -> SVY21Coordinates:
-        latitude_radians = self.degrees_to_radians(latitude)
-        longitude_radians = self.degrees_to_radians(longitude)
+        latitude_radians = math.radians(latitude)
+        longitude_radians = math.radians(longitude)
 
-        sin_latitude = np.sin(latitude_radians)
-        cos_latitude = np.cos(latitude_radians)
+        sin_latitude = math.sin(latitude_radians)
+        cos_latitude = math.cos(latitude_radians)
 
         meridian_distance = self._calculate_meridian_distance(latitude_radians)
-        meridian_distance_origin = self._calculate_meridian_distance(
-            self.degrees_to_radians(self.ORIGIN_LATITUDE)
-        )
+        meridian_distance_origin = self._meridian_distance_origin
 
-        delta_longitude = longitude_radians - self.degrees_to_radians(
-            self.ORIGIN_LONGITUDE
-        )
+        delta_longitude = longitude_radians - self._origin_lon_rad
 
         northing = self._compute_northing(
             sin_latitude,
@@ -90,54 +437,68 @@ class CoordinateTransformation:
 
     def _compute_northing(
         self,
-        sin_latitude: float,
-        cos_latitude: float,
-        meridian_distance: float,
+        sin_latitude: FloatOrArray,
+        cos_latitude: FloatOrArray,
+        meridian_distance: FloatOrArray,
         meridian_distance_origin: float,
-        delta_longitude: float,
-    ) -> float:
-        coefficient_a2 = self.equatorial_arc_consts[2]
+        delta_longitude: FloatOrArray,
+    ) -> FloatOrArray:
+        coefficient_a2 = self._a2
+
+        sin_squared_latitude = sin_latitude * sin_latitude
+        cos_squared_latitude = cos_latitude * cos_latitude
+        cos_cubed_latitude = cos_squared_latitude * cos_latitude
+        cos_fourth_latitude = cos_squared_latitude * cos_squared_latitude
+        cos_fifth_latitude = cos_fourth_latitude * cos_latitude
+        cos_sixth_latitude = cos_fourth_latitude * cos_squared_latitude
+        cos_seventh_latitude = cos_sixth_latitude * cos_latitude
+        delta_longitude_squared = delta_longitude * delta_longitude
+        delta_longitude_fourth = delta_longitude_squared * delta_longitude_squared
+        delta_longitude_sixth = delta_longitude_fourth * delta_longitude_squared
+        delta_longitude_eighth = delta_longitude_fourth * delta_longitude_fourth
+        a2_squared = coefficient_a2 * coefficient_a2
+        a2_cubed = a2_squared * coefficient_a2
 
         northing_term1 = (
-            delta_longitude**2
+            delta_longitude_squared
             / 2
             * meridian_distance_origin
             * sin_latitude
             * cos_latitude
         )
         northing_term2 = (
-            delta_longitude**4
+            delta_longitude_fourth
             / 24
             * meridian_distance_origin
             * sin_latitude
-            * cos_latitude**3
-            * (4 * coefficient_a2**2 + coefficient_a2 - sin_latitude**2)
+            * cos_cubed_latitude
+            * (4 * a2_squared + coefficient_a2 - sin_squared_latitude)
         )
         northing_term3 = (
-            delta_longitude**6
+            delta_longitude_sixth
             / 720
             * meridian_distance_origin
             * sin_latitude
-            * cos_latitude**5
+            * cos_fifth_latitude
             * (
-                (8 * coefficient_a2**3) * (11 - 24 * sin_latitude * sin_latitude)
-                - (28 * coefficient_a2**2) * (1 - 6 * sin_latitude * sin_latitude)
-                + coefficient_a2**2 * (1 - 32 * sin_latitude * sin_latitude)
-                - coefficient_a2 * 2 * sin_latitude * sin_latitude
-                + cos_latitude**4
+                (8 * a2_cubed) * (11 - 24 * sin_squared_latitude)
+                - (28 * a2_squared) * (1 - 6 * sin_squared_latitude)
+                + a2_squared * (1 - 32 * sin_squared_latitude)
+                - coefficient_a2 * 2 * sin_squared_latitude
+                + cos_fourth_latitude
             )
         )
         northing_term4 = (
-            delta_longitude**8
+            delta_longitude_eighth
             / 40320
             * meridian_distance_origin
             * sin_latitude
-            * cos_latitude**7
+            * cos_seventh_latitude
             * (
                 1385
-                - 3111 * sin_latitude * sin_latitude
-                + 543 * cos_latitude**4
-                - cos_latitude**6
+                - 3111 * sin_squared_latitude
+                + 543 * cos_fourth_latitude
+                - cos_sixth_latitude
             )
         )
 
@@ -152,39 +513,48 @@ class CoordinateTransformation:
 
     def _compute_easting(
         self,
-        sin_latitude: float,
-        cos_latitude: float,
-        meridian_distance: float,
-        delta_longitude: float,
-    ) -> float:
-        coefficient_a2 = self.equatorial_arc_consts[2]
+        sin_latitude: FloatOrArray,
+        cos_latitude: FloatOrArray,
+        meridian_distance: FloatOrArray,
+        delta_longitude: FloatOrArray,
+    ) -> FloatOrArray:
+        coefficient_a2 = self._a2
+        a2_squared = coefficient_a2 * coefficient_a2
+        a2_cubed = a2_squared * coefficient_a2
+        sin_squared_latitude = sin_latitude * sin_latitude
+        cos_squared_latitude = cos_latitude * cos_latitude
+        cos_fourth_latitude = cos_squared_latitude * cos_squared_latitude
+        cos_sixth_latitude = cos_fourth_latitude * cos_squared_latitude
+        delta_longitude_squared = delta_longitude * delta_longitude
+        delta_longitude_fourth = delta_longitude_squared * delta_longitude_squared
+        delta_longitude_sixth = delta_longitude_fourth * delta_longitude_squared
 
         easting_term1 = (
-            delta_longitude**2
+            delta_longitude_squared
             / 6
             * cos_latitude
-            * (coefficient_a2 - sin_latitude**2)
+            * (coefficient_a2 - sin_squared_latitude)
         )
         easting_term2 = (
-            delta_longitude**4
+            delta_longitude_fourth
             / 120
-            * cos_latitude**4
+            * cos_fourth_latitude
             * (
-                (4 * coefficient_a2**3) * (1 - 6 * sin_latitude * sin_latitude)
-                + coefficient_a2**2 * (1 + 8 * sin_latitude * sin_latitude)
-                - coefficient_a2 * 2 * sin_latitude * sin_latitude
-                + cos_latitude**4
+                (4 * a2_cubed) * (1 - 6 * sin_squared_latitude)
+                + a2_squared * (1 + 8 * sin_squared_latitude)
+                - coefficient_a2 * 2 * sin_squared_latitude
+                + cos_fourth_latitude
             )
         )
         easting_term3 = (
-            delta_longitude**6
+            delta_longitude_sixth
             / 5040
-            * cos_latitude**6
+            * cos_sixth_latitude
             * (
                 61
-                - 479 * sin_latitude * sin_latitude
-                + 179 * cos_latitude**4
-                - cos_latitude**6
+                - 479 * sin_squared_latitude
+                + 179 * cos_fourth_latitude
+                - cos_sixth_latitude
             )
         )
 
@@ -198,70 +568,73 @@ class CoordinateTransformation:
         )
 
     def _calculate_latitude_from_northing(self, northings: float) -> float:
-        coefficient_a2 = self.equatorial_arc_consts[2]
-        latitude_radians = self.ORIGIN_LATITUDE * np.pi / 180
+        coefficient_a2 = self._a2
+        a2_squared = coefficient_a2 * coefficient_a2
+        a2_cubed = a2_squared * coefficient_a2
+        a2_fourth = a2_squared * a2_squared
+        a2_fifth = a2_fourth * coefficient_a2
+        a2_sixth = a2_fourth * a2_squared
+        latitude_radians = self._origin_lat_rad
 
         # Iteratively solve for latitude_radians using the northings value
         for _ in range(5):  # Perform 5 iterations for convergence
-            sin_latitude = np.sin(latitude_radians)
+            sin_latitude = math.sin(latitude_radians)
+            sin_squared_latitude = sin_latitude * sin_latitude
             radius_of_curvature_prime_vertical = (
                 self._calculate_radius_of_curvature_prime_vertical(sin_latitude)
             )
+            denominator = self.SCALE_FACTOR * radius_of_curvature_prime_vertical
+            denominator_cubed = denominator * denominator * denominator
+            denominator_fifth = denominator_cubed * denominator * denominator
+            denominator_seventh = denominator_fifth * denominator * denominator
 
-            latitude_term1 = (northings - self.FALSE_NORTHING) / (
-                self.SCALE_FACTOR * radius_of_curvature_prime_vertical
-            )
+            latitude_term1 = (northings - self.FALSE_NORTHING) / denominator
             latitude_term2 = (
                 latitude_term1
-                / (self.SCALE_FACTOR * radius_of_curvature_prime_vertical) ** 3
+                / denominator_cubed
                 * (
                     -coefficient_a2
                     / 6
                     * (
                         1
-                        - coefficient_a2**2
+                        - a2_squared
                         * (
                             5
                             + 3 * coefficient_a2
-                            + 10 * coefficient_a2**2
-                            - 4 * coefficient_a2**3
-                            - 9 * sin_latitude**2
+                            + 10 * a2_squared
+                            - 4 * a2_cubed
+                            - 9 * sin_squared_latitude
                         )
                     )
                 )
             )  # Coefficients modified for clarity
             latitude_term3 = (
                 latitude_term1
-                / (self.SCALE_FACTOR * radius_of_curvature_prime_vertical) ** 5
+                / denominator_fifth
                 * (
-                    -(coefficient_a2**3)
+                    -a2_cubed
                     / 120
                     * (
                         5
-                        - 18 * coefficient_a2**2
-                        + coefficient_a2**4
-                        + 14 * sin_latitude**2
-                        - 58 * coefficient_a2**2 * sin_latitude**2
+                        - 18 * a2_squared
+                        + a2_fourth
+                        + 14 * sin_squared_latitude
+                        - 58 * a2_squared * sin_squared_latitude
                     )
                 )
             )
             latitude_term4 = (
                 latitude_term1
-                / (self.SCALE_FACTOR * radius_of_curvature_prime_vertical) ** 7
+                / denominator_seventh
                 * (
-                    -(coefficient_a2**5)
+                    -a2_fifth
                     / 5040
-                    * (
-                        61
-                        - 479 * coefficient_a2**2
-                        + 179 * coefficient_a2**4
-                        - coefficient_a2**6
-                    )
+                    * (61 - 479 * a2_squared + 179 * a2_fourth - a2_sixth)
                 )
             )
 
             latitude_radians = (
-                self.ORIGIN_LATITUDE * np.pi / 180
+                self._origin_lat_rad
                 + latitude_term1
                 + latitude_term2
                 + latitude_term3
@@ -273,34 +646,307 @@ class CoordinateTransformation:
     def _calculate_longitude_from_easting(
         self, eastings: float, latitude_radians: float
     ) -> float:
-        coefficient_a2 = self.equatorial_arc_consts[2]
+        coefficient_a2 = self._a2
+        sin_latitude = math.sin(latitude_radians)
+        sec_latitude = 1.0 / math.cos(latitude_radians)
+        tangent_latitude = math.tan(latitude_radians)
+        tangent_squared_latitude = tangent_latitude * tangent_latitude
+
+        radius_of_curvature = self._calculate_radius_of_curvature(sin_latitude)
+        denominator = self.SCALE_FACTOR * radius_of_curvature * sec_latitude
+        denominator_cubed = denominator * denominator * denominator
+        denominator_fifth = denominator_cubed * denominator * denominator
+        denominator_seventh = denominator_fifth * denominator * denominator
+
+        longitude_term1 = eastings / denominator
+        longitude_term2 = (
+            longitude_term1
+            / denominator_cubed
+            * (coefficient_a2 / 2 * tangent_squared_latitude)
+        )
+        longitude_term3 = (
+            longitude_term1
+            / denominator_fifth
+            * (
+                coefficient_a2
+                / 24
+                * tangent_squared_latitude
+                * (
+                    5
+                    - tangent_squared_latitude
+                    + 9 * coefficient_a2
+                    + 4 * coefficient_a2 * coefficient_a2
+                )
+            )
+        )
+        longitude_term4 = (
+            longitude_term1
+            / denominator_seventh
+            * (
+                coefficient_a2
+                / 720
+                * tangent_squared_latitude
+                * (
+                    61
+                    + 90 * tangent_squared_latitude
+                    + 45 * tangent_squared_latitude * tangent_squared_latitude
+                )
+            )
+        )
+
+        return (
+            self._origin_lon_rad
+            + longitude_term1
+            + longitude_term2
+            + longitude_term3
+            + longitude_term4
+        )
+
+    def convert_lat_lon_to_svy21_batch(
+        self, latitude: np.ndarray, longitude: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Array-in/array-out version of convert_lat_lon_to_svy21.
+
+        Every step operates on whole arrays, so converting N points costs a
+        handful of ufunc calls instead of N Python-level conversions. When
+        numba is installed the work runs in a compiled parallel kernel.
+        """
+        if _HAS_NUMBA:
+            latitude = np.ascontiguousarray(latitude, dtype=np.float64)
+            longitude = np.ascontiguousarray(longitude, dtype=np.float64)
+            northing = np.empty_like(latitude)
+            easting = np.empty_like(latitude)
+            _latlon_to_svy21_kernel(
+                latitude,
+                longitude,
+                self._a1,
+                self._a2,
+                self._a3,
+                self._a4,
+                self.SEMI_MAJOR_AXIS,
+                self._origin_lon_rad,
+                self._meridian_distance_origin,
+                self.FALSE_NORTHING,
+                self.FALSE_EASTING,
+                self.SCALE_FACTOR,
+                northing,
+                easting,
+            )
+            return northing, easting
+
+        if batch_lat_lon_to_svy21 is not None:
+            latitude = np.ascontiguousarray(latitude, dtype=np.float64)
+            longitude = np.ascontiguousarray(longitude, dtype=np.float64)
+            northing = np.empty_like(latitude)
+            easting = np.empty_like(latitude)
+            batch_lat_lon_to_svy21(
+                latitude,
+                longitude,
+                self._a1,
+                self._a2,
+                self._a3,
+                self._a4,
+                self.SEMI_MAJOR_AXIS,
+                self._origin_lon_rad,
+                self._meridian_distance_origin,
+                self.FALSE_NORTHING,
+                self.FALSE_EASTING,
+                self.SCALE_FACTOR,
+                northing,
+                easting,
+            )
+            return northing, easting
+
+        latitude_radians = np.deg2rad(latitude)
+        longitude_radians = np.deg2rad(longitude)
+
+        sin_latitude = np.sin(latitude_radians)
+        cos_latitude = np.cos(latitude_radians)
+
+        meridian_distance = self._calculate_meridian_distance_batch(latitude_radians)
+        meridian_distance_origin = self._meridian_distance_origin
+
+        delta_longitude = longitude_radians - self._origin_lon_rad
+
+        northing = self._compute_northing(
+            sin_latitude,
+            cos_latitude,
+            meridian_distance,
+            meridian_distance_origin,
+            delta_longitude,
+        )
+        easting = self._compute_easting(
+            sin_latitude, cos_latitude, meridian_distance, delta_longitude
+        )
+
+        return northing, easting
+
+    def convert_svy21_to_lat_lon_batch(
+        self, northings: np.ndarray, eastings: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Array-in/array-out version of convert_svy21_to_lat_lon."""
+        if _HAS_NUMBA:
+            northings = np.ascontiguousarray(northings, dtype=np.float64)
+            eastings = np.ascontiguousarray(eastings, dtype=np.float64)
+            latitude = np.empty_like(northings)
+            longitude = np.empty_like(northings)
+            _svy21_to_latlon_kernel(
+                northings,
+                eastings,
+                self._a2,
+                self.SEMI_MAJOR_AXIS,
+                self.eccentricity_squared,
+                self._origin_lat_rad,
+                self._origin_lon_rad,
+                self.FALSE_NORTHING,
+                self.SCALE_FACTOR,
+                latitude,
+                longitude,
+            )
+            return latitude, longitude
+
+        if batch_svy21_to_lat_lon is not None:
+            northings = np.ascontiguousarray(northings, dtype=np.float64)
+            eastings = np.ascontiguousarray(eastings, dtype=np.float64)
+            latitude = np.empty_like(northings)
+            longitude = np.empty_like(northings)
+            batch_svy21_to_lat_lon(
+                northings,
+                eastings,
+                self._a2,
+                self.SEMI_MAJOR_AXIS,
+                self.eccentricity_squared,
+                self._origin_lat_rad,
+                self._origin_lon_rad,
+                self.FALSE_NORTHING,
+                self.SCALE_FACTOR,
+                latitude,
+                longitude,
+            )
+            return latitude, longitude
+
+        latitude_radians = self._calculate_latitude_from_northing_batch(northings)
+        longitude_radians = self._calculate_longitude_from_easting_batch(
+            eastings, latitude_radians
+        )
+        return np.rad2deg(latitude_radians), np.rad2deg(longitude_radians)
+
+    def _calculate_meridian_distance_batch(
+        self, latitude_radians: np.ndarray
+    ) -> np.ndarray:
+        return self.SEMI_MAJOR_AXIS * (
+            self._a1 * latitude_radians
+            - self._a2 * np.sin(2 * latitude_radians)
+            + self._a3 * np.sin(4 * latitude_radians)
+            - self._a4 * np.sin(6 * latitude_radians)
+        )
+
+    def _calculate_latitude_from_northing_batch(
+        self, northings: np.ndarray
+    ) -> np.ndarray:
+        coefficient_a2 = self._a2
+        a2_squared = coefficient_a2 * coefficient_a2
+        a2_cubed = a2_squared * coefficient_a2
+        a2_fourth = a2_squared * a2_squared
+        a2_fifth = a2_fourth * coefficient_a2
+        a2_sixth = a2_fourth * a2_squared
+        latitude_radians = np.full_like(northings, self._origin_lat_rad)
+
+        for _ in range(5):  # Perform 5 iterations for convergence
+            sin_latitude = np.sin(latitude_radians)
+            sin_squared_latitude = sin_latitude * sin_latitude
+            radius_of_curvature_prime_vertical = self.SEMI_MAJOR_AXIS / np.sqrt(
+                1 - self.eccentricity_squared * sin_latitude
+            )
+            denominator = self.SCALE_FACTOR * radius_of_curvature_prime_vertical
+            denominator_cubed = denominator * denominator * denominator
+            denominator_fifth = denominator_cubed * denominator * denominator
+            denominator_seventh = denominator_fifth * denominator * denominator
+
+            latitude_term1 = (northings - self.FALSE_NORTHING) / denominator
+            latitude_term2 = (
+                latitude_term1
+                / denominator_cubed
+                * (
+                    -coefficient_a2
+                    / 6
+                    * (
+                        1
+                        - a2_squared
+                        * (
+                            5
+                            + 3 * coefficient_a2
+                            + 10 * a2_squared
+                            - 4 * a2_cubed
+                            - 9 * sin_squared_latitude
+                        )
+                    )
+                )
+            )
+            latitude_term3 = (
+                latitude_term1
+                / denominator_fifth
+                * (
+                    -a2_cubed
+                    / 120
+                    * (
+                        5
+                        - 18 * a2_squared
+                        + a2_fourth
+                        + 14 * sin_squared_latitude
+                        - 58 * a2_squared * sin_squared_latitude
+                    )
+                )
+            )
+            latitude_term4 = (
+                latitude_term1
+                / denominator_seventh
+                * (
+                    -a2_fifth
+                    / 5040
+                    * (61 - 479 * a2_squared + 179 * a2_fourth - a2_sixth)
+                )
+            )
+
+            latitude_radians = (
+                self._origin_lat_rad
+                + latitude_term1
+                + latitude_term2
+                + latitude_term3
+                + latitude_term4
+            )
+
+        return latitude_radians
+
+    def _calculate_longitude_from_easting_batch(
+        self, eastings: np.ndarray, latitude_radians: np.ndarray
+    ) -> np.ndarray:
+        coefficient_a2 = self._a2
+        sin_latitude = np.sin(latitude_radians)
         sec_latitude = 1.0 / np.cos(latitude_radians)
         tangent_latitude = np.tan(latitude_radians)
         tangent_squared_latitude = tangent_latitude * tangent_latitude
 
-        longitude_term1 = eastings / (
-            self.SCALE_FACTOR
-            * self._calculate_radius_of_curvature(np.sin(latitude_radians))
-            * sec_latitude
+        poly = 1 - self.eccentricity_squared * sin_latitude * sin_latitude
+        radius_of_curvature = (
+            self.SEMI_MAJOR_AXIS
+            * (1 - self.eccentricity_squared)
+            / (poly * np.sqrt(poly))
         )
+        denominator = self.SCALE_FACTOR * radius_of_curvature * sec_latitude
+        denominator_cubed = denominator * denominator * denominator
+        denominator_fifth = denominator_cubed * denominator * denominator
+        denominator_seventh = denominator_fifth * denominator * denominator
+
+        longitude_term1 = eastings / denominator
         longitude_term2 = (
             longitude_term1
-            / (
-                self.SCALE_FACTOR
-                * self._calculate_radius_of_curvature(np.sin(latitude_radians))
-                * sec_latitude
-            )
-            ** 3
+            / denominator_cubed
             * (coefficient_a2 / 2 * tangent_squared_latitude)
         )
         longitude_term3 = (
             longitude_term1
-            / (
-                self.SCALE_FACTOR
-                * self._calculate_radius_of_curvature(np.sin(latitude_radians))
-                * sec_latitude
-            )
-            ** 5
+            / denominator_fifth
             * (
                 coefficient_a2
                 / 24
@@ -309,18 +955,13 @@ class CoordinateTransformation:
                     5
                     - tangent_squared_latitude
                     + 9 * coefficient_a2
-                    + 4 * coefficient_a2**2
+                    + 4 * coefficient_a2 * coefficient_a2
                 )
             )
         )
         longitude_term4 = (
             longitude_term1
-            / (
-                self.SCALE_FACTOR
-                * self._calculate_radius_of_curvature(np.sin(latitude_radians))
-                * sec_latitude
-            )
-            ** 7
+            / denominator_seventh
             * (
                 coefficient_a2
                 / 720
@@ -328,13 +969,13 @@ class CoordinateTransformation:
                 * (
                     61
                     + 90 * tangent_squared_latitude
-                    + 45 * tangent_squared_latitude**2
+                    + 45 * tangent_squared_latitude * tangent_squared_latitude
                 )
             )
         )
 
         return (
-            self.degrees_to_radians(self.ORIGIN_LONGITUDE)
+            self._origin_lon_rad
             + longitude_term1
             + longitude_term2
             + longitude_term3
@@ -349,34 +990,53 @@ class CoordinateTransformation:
             eastings, latitude_radians
         )
 
-        latitude_degrees = self.radians_to_degrees(latitude_radians)
-        longitude_degrees = self.radians_to_degrees(longitude_radians)
+        latitude_degrees = math.degrees(latitude_radians)
+        longitude_degrees = math.degrees(longitude_radians)
 
         return DegreeCoordinates(latitude=latitude_degrees, longitude=longitude_degrees)
 
     def _calculate_meridian_distance(self, latitude_radians: float) -> float:
-        (
-            coefficient_a1,
-            coefficient_a2,
-            coefficient_a3,
-            coefficient_a4,
-        ) = self.equatorial_arc_consts.values()
         return self.SEMI_MAJOR_AXIS * (
-            coefficient_a1 * latitude_radians
-            - coefficient_a2 * np.sin(2 * latitude_radians)
-            + coefficient_a3 * np.sin(4 * latitude_radians)
-            - coefficient_a4 * np.sin(6 * latitude_radians)
+            self._a1 * latitude_radians
+            - self._a2 * math.sin(2 * latitude_radians)
+            + self._a3 * math.sin(4 * latitude_radians)
+            - self._a4 * math.sin(6 * latitude_radians)
         )
 
-    def _calculate_radius_of_curvature(self, sin_squared_latitude: float) -> float:
+    def _calculate_radius_of_curvature(self, sin_latitude: float) -> float:
         num = self.SEMI_MAJOR_AXIS * (1 - self.eccentricity_squared)
-        denom = np.power(
-            1 - self.eccentricity_squared * np.sin(sin_squared_latitude), 3.0 / 2.0
-        )
-        return num / denom
+        poly = 1 - self.eccentricity_squared * sin_latitude * sin_latitude
+        return num / (poly * math.sqrt(poly))
 
     def _calculate_radius_of_curvature_prime_vertical(
         self, sin_squared_latitude: float
     ) -> float:
         poly = 1 - self.eccentricity_squared * sin_squared_latitude
-        return self.SEMI_MAJOR_AXIS / np.sqrt(poly)
+        return self.SEMI_MAJOR_AXIS / math.sqrt(poly)
+
+
+_DEFAULT_TRANSFORMER = CoordinateTransformation()
+
+
+def get_default_transformer() -> CoordinateTransformation:
+    """Return the shared transformer instance.
+
+    CoordinateTransformation is stateless after construction, so callers
+    should reuse this instead of paying for __init__ on every use.
+    """
+    return _DEFAULT_TRANSFORMER
+
+
+def svy21_to_lat_lon_ufunc(
+    northings: np.ndarray, eastings: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert SVY21 arrays to (latitude, longitude) arrays.
+
+    Delegates to the shared transformer's batch conversion, which picks
+    the fastest available backend (parallel numba kernel, C extension,
+    or whole-array NumPy).
+    """
+    return _DEFAULT_TRANSFORMER.convert_svy21_to_lat_lon_batch(
+        np.asarray(northings, dtype=np.float64),
+        np.asarray(eastings, dtype=np.float64),
+    )
@@ -1,17 +1,57 @@
 import json
+import time
 import traceback
 from abc import ABC
-from typing import Any, Dict, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from zc_parking.constants import LOT_TYPE_MAPPING
+from zc_parking.coordinate_transformation import svy21_to_lat_lon_ufunc
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _map_lot_types(lot_types: pd.Series) -> "pd.Categorical[str]":
+    # renaming 3 categories beats mapping every row through a dict
+    categorical = pd.Categorical(lot_types, categories=list(LOT_TYPE_MAPPING.keys()))
+    return categorical.rename_categories(LOT_TYPE_MAPPING)
+
+
+def _records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    # pyarrow builds the table column-wise in C and skips pandas' per-row
+    # type inference; from_records is the fastest pure-pandas path
+    if pa is not None:
+        return pa.Table.from_pylist(records).to_pandas()
+    return pd.DataFrame.from_records(records)
 
 
 class ParkingAPI(ABC):
     _headers: Dict[str, str]
+    _session: Optional[requests.Session] = None
+
+    def _get_session(self) -> requests.Session:
+        # one session per instance so repeated calls reuse the pooled
+        # TCP/TLS connection instead of handshaking every time
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
 
     def _make_api_call(
         self,
@@ -21,13 +61,14 @@ class ParkingAPI(ABC):
         timeout: int = 10,
     ) -> Dict[str, Any]:
         params = params or {}
-        additional_headers = additional_headers or {}
 
         logger.info(
             f"making 1 api call to {endpoint} with params {params}, timeout {timeout}"
         )
-        auth_header = self._headers | additional_headers
-        response = requests.get(
+        auth_header = (
+            self._headers | additional_headers if additional_headers else self._headers
+        )
+        response = self._get_session().get(
             endpoint, headers=auth_header, params=params, timeout=timeout
         )
 
@@ -35,22 +76,34 @@ class ParkingAPI(ABC):
             logger.error(f"failed to retrieve data from {endpoint}")
             return {"error": response.text}
 
-        return self._text_json_to_dict(response.text)
+        return self._text_json_to_dict(response.content)
 
-    def _text_json_to_dict(self, text: str) -> Dict[str, Any]:
+    def _text_json_to_dict(self, text: str | bytes) -> Dict[str, Any]:
+        # orjson decodes the raw bytes 2-3x faster than stdlib json;
+        # ValueError covers both orjson.JSONDecodeError and json.JSONDecodeError
         try:
-            return dict(json.loads(text))
-        except json.JSONDecodeError:
+            if orjson is not None:
+                return orjson.loads(text)  # pylint: disable=no-member
+            return json.loads(text)
+        except ValueError:
             logger.error(f"failed to decode json: {traceback.format_exc()}")
             return {"failed to decode": text}
 
 
+# tokens are tied to an access key and only valid on the day they are
+# issued, so instances sharing a key can reuse them until midnight
+_TOKEN_CACHE: Dict[str, Tuple[date, str]] = {}
+
+
 class URAParkingAPI(ParkingAPI):
     TOKEN_ENDPOINT = "https://www.ura.gov.sg/uraDataService/insertNewToken.action"
     CARPARK_LOTS_ENDPOINT = "https://www.ura.gov.sg/uraDataService/invokeUraDS?service=Car_Park_Availability"
     CARPARK_LIST_RATES_ENDPOINT = (
         "https://www.ura.gov.sg/uraDataService/invokeUraDS?service=Car_Park_Details"
     )
+    # URA refreshes lot availability every few minutes; rates rarely change
+    LOTS_CACHE_TTL_SECONDS = 60
+    LIST_RATES_CACHE_TTL_SECONDS = 60 * 60 * 24
 
     def __init__(self, access_key: str, token: Optional[str] = None):
         self._headers = {
@@ -58,6 +111,8 @@ class URAParkingAPI(ParkingAPI):
             "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/106.0.0.0 Safari/537.36",
             "x-requested-with": "XMLHttpRequest",
         }
+        self._lots_cache: Optional[Tuple[float, pd.DataFrame]] = None
+        self._list_rates_cache: Optional[Tuple[float, pd.DataFrame]] = None
         token = token or self._get_token()
         self._headers |= {"Token": token}
 
@@ -69,14 +124,26 @@ class URAParkingAPI(ParkingAPI):
         timeout: int = 10,
     ) -> Dict[str, Any]:
         result = super()._make_api_call(endpoint, additional_headers, params, timeout)
-        if result["Status"] != "Success":
+        if result.get("Status") != "Success":
             logger.warning(f"failed to retrieve data from {endpoint}")
+            # a failed call usually means the day's token has lapsed; drop
+            # it so the next instance re-authenticates instead of reusing it
+            _TOKEN_CACHE.pop(self._headers["AccessKey"], None)
         return result
 
     def _get_token(self, timeout: int = 5) -> str:
+        access_key = self._headers["AccessKey"]
+        cached = _TOKEN_CACHE.get(access_key)
+        if cached is not None:
+            issued_on, cached_token = cached
+            if issued_on == date.today():
+                logger.info("reusing cached URA token")
+                return cached_token
+            del _TOKEN_CACHE[access_key]
+
         logger.info("attempting to authenticate with URA api...")
 
-        response = requests.get(
+        response = self._get_session().get(
             self.TOKEN_ENDPOINT, headers=self._headers, timeout=timeout
         )
 
@@ -84,40 +151,75 @@ class URAParkingAPI(ParkingAPI):
             logger.error(response.text)
             raise ValueError("Failed to Authenticate with URA API")
 
-        result = self._text_json_to_dict(response.text)
+        result = self._text_json_to_dict(response.content)
 
         if result["Status"] != "Success":
             logger.warning(f"Failed to retrieve token, error message: {result}")
         else:
             logger.info("authentication success")
 
-        return result.get("Result", "")
+        token = result.get("Result", "")
+        if token:
+            _TOKEN_CACHE[access_key] = (date.today(), token)
+        return token
 
     def get_carpark_lots(self) -> pd.DataFrame:
+        cached_lots = self._read_cache(self._lots_cache, self.LOTS_CACHE_TTL_SECONDS)
+        if cached_lots is not None:
+            return cached_lots
+
         carpark_lots_response = self._make_api_call(endpoint=self.CARPARK_LOTS_ENDPOINT)
         if carpark_lots := carpark_lots_response.get("Result"):
-            df = pd.DataFrame(carpark_lots)
-            return self._process_lots_data(df)
+            df = _records_to_dataframe(carpark_lots)
+            processed = self._process_lots_data(df)
+            # cache a copy so the frame handed to the caller is never aliased
+            self._lots_cache = (time.monotonic(), processed.copy())
+            return processed
         return pd.DataFrame()
 
+    @staticmethod
+    def _read_cache(
+        cache: Optional[Tuple[float, pd.DataFrame]], ttl_seconds: float
+    ) -> Optional[pd.DataFrame]:
+        if cache is None:
+            return None
+        timestamp, data = cache
+        if time.monotonic() - timestamp >= ttl_seconds:
+            return None
+        # copy so callers mutating the result cannot poison the cache
+        return data.copy()
+
     def _process_lots_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        data["lotType"] = data["lotType"].map(LOT_TYPE_MAPPING)
+        data["lotType"] = _map_lot_types(data["lotType"])
         return data
 
     def _process_coordinates(self, data: pd.DataFrame) -> pd.DataFrame:
         data = data.explode("geometries", ignore_index=True)
-        data["geometries"] = data["geometries"].apply(
-            lambda x: dict(x).get("coordinates", "0,0")
+        data["geometries"] = data["geometries"].str.get("coordinates").fillna("0,0")
+        coordinates = (
+            data["geometries"].str.split(",", expand=True).astype(float).to_numpy()
+        )
+        latitude, longitude = svy21_to_lat_lon_ufunc(
+            coordinates[:, 1], coordinates[:, 0]
         )
-        # TODO: convert SVY21 to LatLon
+        data["latitude"] = latitude
+        data["longitude"] = longitude
         return data
 
     def get_carpark_list_and_rates(self) -> pd.DataFrame:
+        cached_list_rates = self._read_cache(
+            self._list_rates_cache, self.LIST_RATES_CACHE_TTL_SECONDS
+        )
+        if cached_list_rates is not None:
+            return cached_list_rates
+
         carpark_list_and_rates_response = self._make_api_call(
             endpoint=self.CARPARK_LIST_RATES_ENDPOINT
         )
         if list_and_rates := carpark_list_and_rates_response.get("Result"):
-            return pd.DataFrame(list_and_rates)
+            df = _records_to_dataframe(list_and_rates)
+            self._list_rates_cache = (time.monotonic(), df.copy())
+            return df
         return pd.DataFrame()
 
 
@@ -132,13 +234,13 @@ class LTAParkingAPI(ParkingAPI):
     def get_parking_availability(self) -> pd.DataFrame:
         data = self._make_api_call(endpoint=self.PARKING_AVAILABILITY_ENDPOINT)
         if "value" in data:
-            df = pd.DataFrame(data["value"])
+            df = _records_to_dataframe(data["value"])
             return self._process_parking_availability_data(df)
         logger.warning(f"unexpected data: {data}")
         return pd.DataFrame()
 
     def _process_parking_availability_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        data["LotType"] = data["LotType"].map(LOT_TYPE_MAPPING)
+        data["LotType"] = _map_lot_types(data["LotType"])
         return self._filter_for_only_lta(data)
 
     def _filter_for_only_lta(self, data: pd.DataFrame):